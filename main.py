@@ -1,43 +1,15 @@
-import pandas as pd
-import numpy as np
-import matplotlib.pyplot as plt
+from momentum.config_loader import load_config_yaml
+from momentum.logger import setup_logger
+from momentum.pipeline import pipeline
+from momentum.optimizer import optimize_optuna
+from momentum.report import render_report
 
-from logger import setup_logger
-from pipeline import pipeline
-from optimizer import optimize_optuna
 
-
-def plot_performance(bkt_result, title="Strategy Performance"):
+def plot_performance(bkt_result, title="Strategy Performance", path="reports/performance"):
     """
-    Plot cumulative PnL, rolling Sharpe, and drawdown.
+    Write cumulative PnL, rolling Sharpe, and drawdown tear sheet (PNG + HTML) to disk.
     """
-    pnl_ptf = bkt_result['pnl_ptf']
-    cum_pnl = pnl_ptf.cumsum()
-
-    # Rolling Sharpe (window=20 days)
-    rolling_sharpe = pnl_ptf.rolling(20).mean() / pnl_ptf.rolling(20).std() * np.sqrt(252)
-
-    # Drawdown
-    roll_max = cum_pnl.cummax()
-    drawdown = cum_pnl / roll_max - 1
-
-    fig, axes = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
-    fig.suptitle(title, fontsize=16)
-
-    axes[0].plot(cum_pnl, color="blue")
-    axes[0].set_ylabel("Cumulative PnL")
-
-    axes[1].plot(rolling_sharpe, color="green")
-    axes[1].axhline(1.0, color="red", linestyle="--", label="Sharpe=1")
-    axes[1].set_ylabel("Rolling Sharpe")
-    axes[1].legend()
-
-    axes[2].plot(drawdown, color="red")
-    axes[2].set_ylabel("Drawdown")
-    axes[2].set_xlabel("Date")
-
-    plt.tight_layout()
-    plt.show()
+    return render_report(bkt_result, path, title=title, formats=("png", "html"))
 
 
 def main():
@@ -45,15 +17,14 @@ def main():
 
     # === Configuration ===
     config_path = "config.yaml"
-    instruments = [
-        'hc', 'rb', 'i', 'j', 'jm', 'au', 'ag', 'v', 'ru', 'l', 'pp', 'bu', 'TA', 'FG', 'MA',
-        'y', 'p', 'm', 'a', 'c', 'cs', 'jd', 'RM', 'CF', 'SR', 'OI'
-    ]
-    start_date = 20180101
-    end_date = 20190101
-    strategy = "simple"
-
-    n_trials = 2**12
+    config = load_config_yaml(config_path)
+    universe = config["universe"]
+    instruments = universe["instruments"]
+    start_date = universe["start_date"]
+    end_date = universe.get("end_date")
+    strategy = universe.get("strategy", "simple")
+
+    n_trials = config.get("optimize", {}).get("n_trials", 50)
 
     # === Run baseline pipeline ===
     logger.info("=== Baseline pipeline (exponential) ===")
@@ -0,0 +1,246 @@
+"""
+Command line entry point: ``momentum run|optimize|sweep|export``.
+
+Universe, dates and trial counts come from config.yaml and can be overridden
+by flags. Heavy dependencies (pandas via the pipeline, optuna, sqlalchemy,
+matplotlib) are only imported inside the subcommand that needs them, so
+``momentum --help`` and plain backtests start quickly.
+"""
+import argparse
+import math
+from pathlib import Path
+
+from momentum.config_loader import load_config_yaml
+from momentum.logger import setup_logger
+
+
+def _csv(value: str) -> list[str]:
+    return [v.strip() for v in value.split(",") if v.strip()]
+
+
+def _csv_int(value: str) -> list[int]:
+    return [int(v) for v in _csv(value)]
+
+
+def _override(value, default):
+    return value if value is not None else default
+
+
+def _settings(args: argparse.Namespace) -> dict:
+    """
+    Merge the config.yaml universe section with command line overrides.
+    """
+    config_path = Path(args.config)
+    if not config_path.is_file():
+        raise SystemExit(f"Config file not found: {config_path.resolve()} "
+                         f"(run from the project directory or pass --config)")
+    config = load_config_yaml(config_path)
+    universe = config.get("universe", {})
+    optimize = config.get("optimize", {})
+
+    db_path = config.get("data", {}).get("db_path")
+    if not db_path or not Path(db_path).is_file():
+        raise SystemExit(f"Database not found: {db_path} (set data.db_path in {config_path})")
+
+    settings = {
+        "config_path": config_path,
+        "instruments": _override(args.instruments, universe.get("instruments")),
+        "start_date": _override(args.start_date, universe.get("start_date", 20180101)),
+        "end_date": _override(args.end_date, universe.get("end_date")),
+        "strategy": _override(args.strategy, universe.get("strategy", "simple")),
+        "table": config.get("data", {}).get("table", "AdjustedFuturesDaily"),
+        "n_trials": _override(getattr(args, "n_trials", None), optimize.get("n_trials", 50)),
+        "min_sharpe": _override(getattr(args, "min_sharpe", None), optimize.get("min_sharpe", 1.7)),
+    }
+    if not settings["instruments"]:
+        raise SystemExit("No instruments given: set universe.instruments in config or pass --instruments")
+    return settings
+
+
+def _log_perf(logger, label: str, perf: dict) -> None:
+    logger.info(f"{label}: Sharpe={perf.get('sharpe', 0):.2f}, "
+                f"AnnRet={perf.get('ann_return', 0):.2%}, "
+                f"Calmar={perf.get('calmar', 0):.2f}")
+
+
+def cmd_run(args: argparse.Namespace) -> int:
+    from momentum.pipeline import pipeline
+
+    s = _settings(args)
+    logger = setup_logger(verbose=True, name="momentum")
+    result = pipeline(
+        config_path=s["config_path"],
+        instruments=s["instruments"],
+        start_date=s["start_date"],
+        end_date=s["end_date"],
+        strategy=s["strategy"],
+        table=s["table"],
+        plot=args.plot,
+        report_dir=args.report_dir,
+        verbose=args.verbose,
+    )
+    _log_perf(logger, f"Performance ({s['strategy']})", result["performance"])
+    return 0
+
+
+def cmd_optimize(args: argparse.Namespace) -> int:
+    from momentum.optimizer import optimize_optuna
+    from momentum.pipeline import pipeline
+
+    s = _settings(args)
+    logger = setup_logger(verbose=True, name="momentum")
+    logger.info(f"=== Starting optimization ({s['n_trials']} trials) ===")
+    best_params, best_perf = optimize_optuna(
+        run_pipeline=pipeline,
+        config_path=s["config_path"],
+        instruments=s["instruments"],
+        start_date=s["start_date"],
+        end_date=s["end_date"],
+        min_sharpe=s["min_sharpe"],
+        n_trials=s["n_trials"],
+        verbose=args.verbose,
+    )
+    logger.info(f"Best parameters: {best_params}")
+    if not best_params or not best_perf:
+        return 1
+    _log_perf(logger, "Best performance", best_perf)
+
+    if args.plot:
+        trial_params = {
+            "factor": {"window": best_params.get("window"),
+                       "skip": best_params.get("skip"),
+                       "clip": best_params.get("clip")},
+            "trade": {"trade_percent": best_params.get("trade_percent"),
+                      "gross_target": best_params.get("gross_target"),
+                      "hold_period": best_params.get("hold_period")}
+        }
+        pipeline(
+            config_path=s["config_path"],
+            instruments=s["instruments"],
+            start_date=s["start_date"],
+            end_date=s["end_date"],
+            strategy=best_params.get("strategy", s["strategy"]),
+            table=s["table"],
+            plot=True,
+            report_dir=args.report_dir,
+            trial_params=trial_params,
+        )
+    return 0
+
+
+def cmd_sweep(args: argparse.Namespace) -> int:
+    from momentum.pipeline import pipeline
+
+    s = _settings(args)
+    logger = setup_logger(verbose=True, name="momentum")
+    strategies = args.strategies or [s["strategy"]]
+
+    results = {}
+    for strategy in strategies:
+        for window in args.windows:
+            name = f"{strategy}_w{window}"
+            results[name] = pipeline(
+                config_path=s["config_path"],
+                instruments=s["instruments"],
+                start_date=s["start_date"],
+                end_date=s["end_date"],
+                strategy=strategy,
+                table=s["table"],
+                verbose=args.verbose,
+                trial_params={"factor": {"window": window}},
+            )
+
+    def sharpe(item):
+        value = item[1]["performance"]["sharpe"]
+        return -math.inf if math.isnan(value) else value
+
+    ranked = sorted(results.items(), key=sharpe, reverse=True)
+    for name, result in ranked:
+        _log_perf(logger, name, result["performance"])
+
+    if args.top:
+        from momentum.report import render_reports
+
+        top = {name: result["bkt_result"] for name, result in ranked[:args.top]}
+        render_reports(top, args.report_dir, n_jobs=args.jobs)
+        logger.info(f"Wrote {len(top)} reports to {args.report_dir}")
+    return 0
+
+
+def cmd_export(args: argparse.Namespace) -> int:
+    from momentum.pipeline import pipeline
+
+    s = _settings(args)
+    logger = setup_logger(verbose=True, name="momentum")
+    result = pipeline(
+        config_path=s["config_path"],
+        instruments=s["instruments"],
+        start_date=s["start_date"],
+        end_date=s["end_date"],
+        strategy=s["strategy"],
+        table=s["table"],
+        verbose=args.verbose,
+    )
+
+    out_dir = Path(args.out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    frames = {
+        "adjclose": result["data"],
+        "signal": result["signal"],
+        "position": result["position"],
+        "pnl": result["bkt_result"]["pnl"],
+    }
+    for name, frame in frames.items():
+        # keep the configured universe order rather than the sorted pivot order
+        frame.reindex(columns=s["instruments"]).to_csv(out_dir / f"{name}.csv")
+    logger.info(f"Exported {', '.join(frames)} to {out_dir}")
+    return 0
+
+
+def build_parser() -> argparse.ArgumentParser:
+    common = argparse.ArgumentParser(add_help=False)
+    common.add_argument("--config", default="config.yaml", help="Path to config.yaml")
+    common.add_argument("--instruments", type=_csv, help="Comma separated instrument codes")
+    common.add_argument("--start-date", type=int, help="Start TradingDay (YYYYMMDD)")
+    common.add_argument("--end-date", type=int, help="End TradingDay (YYYYMMDD)")
+    common.add_argument("--strategy", choices=["simple", "linear", "exponential"])
+    common.add_argument("--verbose", action="store_true")
+
+    parser = argparse.ArgumentParser(prog="momentum", description="Momentum futures strategy")
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    run = sub.add_parser("run", parents=[common], help="Run a single backtest")
+    run.add_argument("--plot", action="store_true", help="Write a PNG tear sheet")
+    run.add_argument("--report-dir", default="reports")
+    run.set_defaults(func=cmd_run)
+
+    opt = sub.add_parser("optimize", parents=[common], help="Optuna hyperparameter search")
+    opt.add_argument("--n-trials", type=int)
+    opt.add_argument("--min-sharpe", type=float)
+    opt.add_argument("--plot", action="store_true", help="Write a tear sheet for the best trial")
+    opt.add_argument("--report-dir", default="reports")
+    opt.set_defaults(func=cmd_optimize)
+
+    sweep = sub.add_parser("sweep", parents=[common], help="Grid over strategies and windows")
+    sweep.add_argument("--strategies", type=_csv, help="Comma separated strategies")
+    sweep.add_argument("--windows", type=_csv_int, default=[5, 20, 60, 120, 250],
+                       help="Comma separated lookback windows")
+    sweep.add_argument("--top", type=int, default=0, help="Write tear sheets for the top N runs")
+    sweep.add_argument("--jobs", type=int, help="Report worker processes")
+    sweep.add_argument("--report-dir", default="reports")
+    sweep.set_defaults(func=cmd_sweep)
+
+    export = sub.add_parser("export", parents=[common], help="Export adjclose/signal/position/pnl CSVs")
+    export.add_argument("--out-dir", default="exports")
+    export.set_defaults(func=cmd_export)
+
+    return parser
+
+
+def main(argv: list[str] | None = None) -> int:
+    args = build_parser().parse_args(argv)
+    return args.func(args)
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,15 @@
+from os import PathLike
+from pathlib import Path
+
+import yaml
+
+def load_config_yaml(path: str | PathLike) -> dict:
+    with open(path, "r", encoding='utf-8') as f:
+        config = yaml.safe_load(f) or {}
+
+    # relative db paths are relative to the config file, not the cwd
+    data = config.get("data") or {}
+    if data.get("db_path") and not Path(data["db_path"]).is_absolute():
+        data["db_path"] = str(Path(path).resolve().parent / data["db_path"])
+
+    return config
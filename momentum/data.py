@@ -5,7 +5,6 @@ from collections.abc import Mapping
 from pathlib import Path
 
 import pandas as pd
-from sqlalchemy import create_engine, text
 
 
 def load_data_df_from_sql(
@@ -40,6 +39,9 @@ def load_data_df_from_sql(
     if not (isinstance(start_date, int) and 19000101 <= start_date <= 21001231):
         raise ValueError("start_date must be an int in YYYYMMDD form, e.g. 20180101.")
 
+    # deferred so workers that never hit the database skip the SQLAlchemy import
+    from sqlalchemy import create_engine, text
+
     db_path = Path(db_path).resolve()
     engine = create_engine(f"sqlite:///{db_path.as_posix()}")
 
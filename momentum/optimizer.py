@@ -1,9 +1,7 @@
 from os import PathLike
 from typing import Callable
 
-from logger import setup_logger
-
-import optuna
+from momentum.logger import setup_logger
 
 
 def optimize_optuna_with_soft_penalties(
@@ -108,6 +106,8 @@ def optimize_optuna_with_soft_penalties(
 
         return score
 
+    import optuna
+
     logger = setup_logger(verbose=verbose, name="optuna_optimizer")
 
     # --- Run optimization ---
@@ -160,6 +160,8 @@ def optimize_optuna(
     verbose
     run_pipeline : Callable
     """
+    import optuna
+
     logger = setup_logger(verbose=False, name="optuna_optimizer")
     logger.info(f"Starting Optuna optimization ({n_trials} trials)")
     best_perf_overall = {}
@@ -206,6 +208,9 @@ def optimize_optuna(
         if best_perf_overall is None or sharpe > best_perf_overall.get("sharpe", -1e9):
             best_perf_overall = {"sharpe": sharpe, "params": params, "perf": perf}
 
+        # Save performance for the caller (read back from the best trial)
+        trial.set_user_attr("performance", perf)
+
         # Prune trials that cannot meet minimum Sharpe
         if sharpe < min_sharpe:
             raise optuna.exceptions.TrialPruned()
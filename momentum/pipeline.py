@@ -1,14 +1,15 @@
 from os import PathLike
+from pathlib import Path
 from typing import Literal
-import matplotlib.pyplot as plt
 
-from config_loader import load_config_yaml
-from logger import setup_logger
+from momentum.config_loader import load_config_yaml
+from momentum.logger import setup_logger
 from momentum.backtest import cal_bkt
 from momentum.data import load_data_df_from_sql
 from momentum.position import deltaneutral
 from momentum.signal import logreturns
 from momentum.portfolio import cal_perf
+from momentum.report import render_report
 
 
 def pipeline(config_path: str | PathLike,
@@ -18,10 +19,13 @@ def pipeline(config_path: str | PathLike,
              strategy: str | Literal["simple", "linear", "exponential"] = "simple",
              table: str = "AdjustedFuturesDaily",
              plot: bool = False,
+             report_dir: str | PathLike = "reports",
              verbose: bool = False,
              trial_params: dict | None = None) -> dict:
     """
     Run full pipeline: load data, generate signal, positions, backtest, performance.
+
+    If plot is True, a PNG tear sheet is written to report_dir (headless, Agg backend).
     """
 
     logger = setup_logger(verbose, name="pipeline")
@@ -68,8 +72,9 @@ def pipeline(config_path: str | PathLike,
                 f"Calmar={performance['calmar']:.2f}")
 
     if plot:
-        plt.plot(bkt_result["pnl_ptf"].values.cumsum())
-        plt.title("Cumulative PnL")
-        plt.show()
+        paths = render_report(bkt_result, Path(report_dir) / f"pipeline_{strategy}",
+                              title=f"Cumulative PnL ({strategy})")
+        logger.info(f"Report written to {', '.join(map(str, paths))}")
 
-    return {"performance": performance, "position": position, "bkt_result": bkt_result}
+    return {"performance": performance, "position": position, "bkt_result": bkt_result,
+            "data": data, "signal": signal}
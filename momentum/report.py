@@ -0,0 +1,247 @@
+from __future__ import annotations
+
+import base64
+import html
+import io
+import os
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ProcessPoolExecutor
+from os import PathLike
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+from momentum.portfolio import cal_perf
+
+
+def _pyplot():
+    """
+    Import pyplot on first use with the non-interactive Agg backend.
+
+    Kept out of module scope so that importing this module (e.g. from an
+    optimizer worker) does not pay the matplotlib import cost.
+    """
+    import matplotlib
+    matplotlib.use("Agg")
+    import matplotlib.pyplot as plt
+    return plt
+
+
+def rolling_stats(pnl_ptf: pd.Series, window: int = 20) -> pd.DataFrame:
+    """
+    Vectorized cumulative PnL, rolling Sharpe and drawdown.
+
+    Parameters
+    ----------
+    pnl_ptf : pd.Series
+        Daily portfolio returns (e.g. bkt_result['pnl_ptf']).
+    window : int
+        Rolling Sharpe window in days.
+
+    Returns
+    -------
+    pd.DataFrame
+        Columns 'cum_pnl', 'rolling_sharpe', 'drawdown', indexed like pnl_ptf.
+        'rolling_sharpe' is NaN for the first window-1 rows and where the
+        rolling std is zero. 'drawdown' is measured on compounded equity,
+        as in cal_perf.
+    """
+    if window < 2:
+        raise ValueError("'window' must be >= 2")
+
+    r = np.nan_to_num(pnl_ptf.to_numpy(dtype=float))
+    n = r.shape[0]
+
+    cum_pnl = np.cumsum(r)
+
+    # rolling mean / std (ddof=1) from running sums
+    rolling_sharpe = np.full(n, np.nan)
+    if n >= window:
+        csum = np.concatenate(([0.0], cum_pnl))
+        csum2 = np.concatenate(([0.0], np.cumsum(r * r)))
+        s1 = csum[window:] - csum[:-window]
+        s2 = csum2[window:] - csum2[:-window]
+        mean = s1 / window
+        var = np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0)
+        std = np.sqrt(var)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            sharpe = np.where(std > 0, mean / std * np.sqrt(252), np.nan)
+        rolling_sharpe[window - 1:] = sharpe
+
+    equity = np.cumprod(1.0 + r)
+    drawdown = equity / np.maximum.accumulate(equity) - 1
+
+    return pd.DataFrame(
+        {"cum_pnl": cum_pnl, "rolling_sharpe": rolling_sharpe, "drawdown": drawdown},
+        index=pnl_ptf.index,
+    )
+
+
+def _render(stats: pd.DataFrame,
+            performance: dict,
+            path: Path,
+            title: str,
+            formats: tuple[str, ...]) -> list[Path]:
+    """
+    Draw the tear sheet from precomputed stats and write it in each format.
+    """
+    plt = _pyplot()
+
+    fig, axes = plt.subplots(3, 1, figsize=(12, 10), sharex=True)
+    fig.suptitle(title, fontsize=16)
+
+    x = np.arange(len(stats))
+    axes[0].plot(x, stats["cum_pnl"].to_numpy(), color="blue")
+    axes[0].set_ylabel("Cumulative PnL")
+
+    axes[1].plot(x, stats["rolling_sharpe"].to_numpy(), color="green")
+    axes[1].axhline(1.0, color="red", linestyle="--", label="Sharpe=1")
+    axes[1].set_ylabel("Rolling Sharpe")
+    axes[1].legend()
+
+    axes[2].plot(x, stats["drawdown"].to_numpy(), color="red")
+    axes[2].set_ylabel("Drawdown")
+    axes[2].set_xlabel("Date")
+
+    # label a handful of ticks with the original index (e.g. TradingDay ints)
+    if len(stats):
+        ticks = np.unique(np.linspace(0, len(stats) - 1, num=min(8, len(stats))).astype(int))
+        axes[2].set_xticks(ticks)
+        axes[2].set_xticklabels([str(stats.index[i]) for i in ticks], rotation=30)
+
+    fig.tight_layout()
+
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=100)
+    plt.close(fig)
+    png = buf.getvalue()
+
+    written = []
+    if "png" in formats:
+        out = path.parent / f"{path.name}.png"
+        out.write_bytes(png)
+        written.append(out)
+    if "html" in formats:
+        rows = "".join(
+            f"<tr><th>{k}</th><td>{v:.4f}</td></tr>" for k, v in performance.items()
+        )
+        img = base64.b64encode(png).decode("ascii")
+        safe_title = html.escape(title)
+        page = (
+            f"<!DOCTYPE html><html><head><meta charset='utf-8'><title>{safe_title}</title></head>"
+            f"<body><h1>{safe_title}</h1><table>{rows}</table>"
+            f"<img src='data:image/png;base64,{img}'/></body></html>"
+        )
+        out = path.parent / f"{path.name}.html"
+        out.write_text(page, encoding="utf-8")
+        written.append(out)
+
+    return written
+
+
+def render_report(bkt_result: dict,
+                  path: str | PathLike,
+                  title: str = "Strategy Performance",
+                  formats: Iterable[str] = ("png",),
+                  window: int = 20) -> list[Path]:
+    """
+    Render a single tear sheet (cumulative PnL, rolling Sharpe, drawdown) to disk.
+
+    Parameters
+    ----------
+    bkt_result : dict
+        Output of cal_bkt; must contain 'pnl_ptf'.
+    path : str | PathLike
+        Output path stem; '.png' / '.html' is appended per format, so dots
+        in the name are kept.
+    title : str
+        Figure title.
+    formats : Iterable[str]
+        Any of 'png', 'html'.
+    window : int
+        Rolling Sharpe window in days.
+
+    Returns
+    -------
+    list[Path]
+        Files written.
+    """
+    formats = _check_formats(formats)
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+
+    stats = rolling_stats(bkt_result["pnl_ptf"], window)
+    return _render(stats, cal_perf(bkt_result), path, title, formats)
+
+
+def render_reports(bkt_results: Mapping[str, dict],
+                   out_dir: str | PathLike,
+                   formats: Iterable[str] = ("png", "html"),
+                   window: int = 20,
+                   n_jobs: int | None = None) -> dict[str, list[Path]]:
+    """
+    Render tear sheets for many backtests in parallel across processes.
+
+    Rolling stats and performance are computed once in the parent, so
+    workers only receive the three summary series rather than the full
+    per-asset PnL.
+
+    Parameters
+    ----------
+    bkt_results : Mapping[str, dict]
+        Report name -> cal_bkt output. Names are used as file stems and must
+        not contain path separators.
+    out_dir : str | PathLike
+        Directory the reports are written into.
+    formats : Iterable[str]
+        Any of 'png', 'html'.
+    window : int
+        Rolling Sharpe window in days.
+    n_jobs : int, optional
+        Number of worker processes (default: os.cpu_count()). 1 renders inline.
+
+    Returns
+    -------
+    dict[str, list[Path]]
+        Report name -> files written.
+    """
+    formats = _check_formats(formats)
+    for name in bkt_results:
+        _check_name(name)
+    out_dir = Path(out_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    tasks = {
+        name: (
+            rolling_stats(bkt["pnl_ptf"], window),
+            cal_perf(bkt),
+            out_dir / str(name),
+            str(name),
+            formats,
+        )
+        for name, bkt in bkt_results.items()
+    }
+
+    n_jobs = min(n_jobs or os.cpu_count() or 1, max(len(tasks), 1))
+    if n_jobs == 1:
+        return {name: _render(*args) for name, args in tasks.items()}
+
+    with ProcessPoolExecutor(max_workers=n_jobs) as pool:
+        futures = {name: pool.submit(_render, *args) for name, args in tasks.items()}
+        return {name: fut.result() for name, fut in futures.items()}
+
+
+def _check_formats(formats: Iterable[str]) -> tuple[str, ...]:
+    formats = tuple(formats)
+    unknown = set(formats) - {"png", "html"}
+    if not formats or unknown:
+        raise ValueError(f"formats must be a non-empty subset of ('png', 'html'), got {formats}")
+    return formats
+
+
+def _check_name(name: str) -> None:
+    name = str(name)
+    separators = {"/", os.sep} | ({os.altsep} if os.altsep else set())
+    if name in ("", ".", "..") or any(sep in name for sep in separators):
+        raise ValueError(f"report name must be a plain file stem, got {name!r}")
@@ -0,0 +1,141 @@
+from __future__ import annotations
+
+import atexit
+import os
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+from multiprocessing import shared_memory
+
+import numpy as np
+import pandas as pd
+
+# segments created by this process: name -> (SharedMemory, owner pid)
+_PUBLISHED: dict[str, tuple[shared_memory.SharedMemory, int]] = {}
+# segments attached in this process; kept alive for as long as views exist
+_ATTACHED: dict[str, shared_memory.SharedMemory] = {}
+
+
+def publish_panel(frame: pd.DataFrame, name: str | None = None) -> dict:
+    """
+    Copy a numeric panel (e.g. load_data_df_from_sql(...)['adjclose'] or its
+    log prices) into shared memory once, for process pool workers to attach to.
+
+    Parameters
+    ----------
+    frame : pd.DataFrame
+        Numeric panel (dates × instruments).
+    name : str, optional
+        Shared memory segment name; generated if omitted.
+
+    Returns
+    -------
+    dict
+        Picklable handle with 'name', 'shape', 'dtype', 'index', 'columns';
+        pass it to workers and call attach_panel(handle) there.
+        The segment is unlinked by release_panel or when this process exits.
+    """
+    values = np.ascontiguousarray(frame.to_numpy())
+    if values.dtype.kind not in "biuf":
+        raise ValueError(f"panel must be numeric, got dtype {values.dtype}")
+
+    shm = shared_memory.SharedMemory(name=name, create=True, size=max(values.nbytes, 1))
+    view = np.ndarray(values.shape, dtype=values.dtype, buffer=shm.buf)
+    view[...] = values
+    del view  # release the export so close() succeeds later
+
+    _PUBLISHED[shm.name] = (shm, os.getpid())
+
+    return {
+        "name": shm.name,
+        "shape": values.shape,
+        "dtype": values.dtype.str,
+        "index": frame.index,
+        "columns": frame.columns,
+    }
+
+
+def attach_panel(handle: dict) -> pd.DataFrame:
+    """
+    Wrap a published panel as a read-only DataFrame without copying.
+
+    Parameters
+    ----------
+    handle : dict
+        Handle returned by publish_panel.
+
+    Returns
+    -------
+    pd.DataFrame
+        Backed directly by the shared segment; writes raise ValueError.
+    """
+    name = handle["name"]
+    shm = _ATTACHED.get(name)
+    if shm is None:
+        owned = _PUBLISHED.get(name)
+        if owned is not None:
+            shm = owned[0]
+        else:
+            try:
+                # 3.13+: the creator owns cleanup, don't track the segment here
+                shm = shared_memory.SharedMemory(name=name, track=False)
+            except TypeError:
+                shm = shared_memory.SharedMemory(name=name)
+        _ATTACHED[name] = shm
+
+    values = np.ndarray(handle["shape"], dtype=np.dtype(handle["dtype"]), buffer=shm.buf)
+    values.flags.writeable = False
+
+    return pd.DataFrame(values, index=handle["index"], columns=handle["columns"], copy=False)
+
+
+def release_panel(handle: dict) -> None:
+    """
+    Unlink a panel published by this process. Workers must be done with it.
+    """
+    _release(handle["name"])
+
+
+@contextmanager
+def shared_panels(frames: Mapping[str, pd.DataFrame]) -> Iterator[dict[str, dict]]:
+    """
+    Publish several panels for the duration of a with-block.
+
+    Example
+    -------
+    >>> with shared_panels({"adjclose": data, "log_p": np.log(data)}) as handles:
+    ...     pool.map(worker, [handles] * n_folds)
+    """
+    handles = {}
+    try:
+        for key, frame in frames.items():
+            handles[key] = publish_panel(frame)
+        yield handles
+    finally:
+        for handle in handles.values():
+            release_panel(handle)
+
+
+def _release(name: str) -> None:
+    _ATTACHED.pop(name, None)
+    owned = _PUBLISHED.pop(name, None)
+    if owned is None:
+        return
+    shm, pid = owned
+    # forked children inherit this registry but must not unlink the parent's segments
+    if pid != os.getpid():
+        return
+    try:
+        shm.close()
+    except BufferError:
+        # views still alive in this process; the mapping goes away at exit
+        pass
+    try:
+        shm.unlink()
+    except FileNotFoundError:
+        pass
+
+
+@atexit.register
+def _cleanup() -> None:
+    for name in list(_PUBLISHED):
+        _release(name)
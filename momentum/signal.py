@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import warnings
 from typing import Literal
 
 import numpy as np
@@ -32,6 +33,9 @@ def logreturns(
             'clip' (float, optional): symmetric winsorization bound
             'mode' (str): 'simple', 'linear', 'ewm'
             'alpha' (float): decay factor for 'ewm' mode
+            'mad' (float, optional): cross-sectional MAD winsorization bound
+            'normalize' (str, optional): 'rank', 'zscore' or 'vol', see normalize()
+            'vol_window' (int, default=20): volatility lookback for 'vol'
 
     Returns
     -------
@@ -84,4 +88,193 @@ def logreturns(
             raise ValueError("'clip' must be positive if provided")
         signal = signal.clip(lower=-clip, upper=clip)
 
+    # optional cross-sectional normalisation
+    method = dict_parameter.get("normalize", None)
+    mad = dict_parameter.get("mad", None)
+    if method is not None:
+        signal = normalize(signal, method, mad=mad, returns=log_p.diff(),
+                           vol_window=int(dict_parameter.get("vol_window", 20)))
+    elif mad is not None:
+        signal = pd.DataFrame(mad_winsorize(signal.to_numpy(dtype=float), float(mad)),
+                              index=signal.index, columns=signal.columns)
+
     return signal
+
+
+# ---------------------------------------------------------------------------
+# Cross-sectional normalisation
+#
+# All helpers below operate on arrays shaped (..., dates, instruments): the
+# last axis is the cross-section of one date, the one before it is time, and
+# any leading axes are a batch of signal matrices (e.g. np.stack of many
+# candidate signals). NaN marks instruments not yet listed and is preserved.
+# ---------------------------------------------------------------------------
+
+def cs_rank(x: np.ndarray) -> np.ndarray:
+    """
+    Cross-sectional rank scaled to [-1, 1], NaN-aware, ties averaged.
+
+    Rows with a single valid instrument get 0.
+    """
+    x = np.asarray(x, dtype=float)
+    n = x.shape[-1]
+    valid = ~np.isnan(x)
+
+    # NaN sorts last, so valid entries occupy the first `count` slots
+    order = np.argsort(x, axis=-1, kind="stable")
+    s = np.take_along_axis(x, order, axis=-1)
+    idx = np.broadcast_to(np.arange(n), x.shape)
+
+    # average ordinal over each run of equal values
+    starts = np.ones(x.shape, dtype=bool)
+    starts[..., 1:] = s[..., 1:] != s[..., :-1]
+    ends = np.ones(x.shape, dtype=bool)
+    ends[..., :-1] = starts[..., 1:]
+    first = np.maximum.accumulate(np.where(starts, idx, 0), axis=-1)
+    last = np.flip(np.minimum.accumulate(np.flip(np.where(ends, idx, n), axis=-1), axis=-1), axis=-1)
+
+    ranks = np.empty_like(x)
+    np.put_along_axis(ranks, order, (first + last) / 2.0, axis=-1)
+
+    count = valid.sum(axis=-1, keepdims=True)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        scaled = np.where(count > 1, 2.0 * ranks / (count - 1) - 1.0, 0.0)
+    return np.where(valid, scaled, np.nan)
+
+
+def cs_zscore(x: np.ndarray) -> np.ndarray:
+    """
+    Cross-sectional z-score (population std), NaN-aware.
+
+    Rows with zero dispersion get 0.
+    """
+    x = np.asarray(x, dtype=float)
+    valid = ~np.isnan(x)
+    count = valid.sum(axis=-1, keepdims=True)
+    filled = np.where(valid, x, 0.0)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        mean = filled.sum(axis=-1, keepdims=True) / count
+        dev = np.where(valid, x - mean, 0.0)
+        std = np.sqrt((dev * dev).sum(axis=-1, keepdims=True) / count)
+        # relative test: a constant row can carry a few ulps of rounding noise
+        tol = 8 * np.finfo(float).eps * np.maximum(np.abs(mean), np.finfo(float).tiny)
+        z = np.where(std > tol, dev / std, 0.0)
+    return np.where(valid, z, np.nan)
+
+
+def mad_winsorize(x: np.ndarray, n_mad: float = 3.0) -> np.ndarray:
+    """
+    Clip each cross-section to median ± n_mad * 1.4826 * MAD, NaN-aware.
+
+    Rows with zero MAD are returned unclipped.
+    """
+    if n_mad <= 0:
+        raise ValueError("'n_mad' must be positive")
+    x = np.asarray(x, dtype=float)
+
+    # nanmedian warns on all-NaN rows (e.g. before any instrument is listed)
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        med = np.nanmedian(x, axis=-1, keepdims=True)
+        mad = np.nanmedian(np.abs(x - med), axis=-1, keepdims=True)
+
+    # MAD is 0 when most instruments share a value (flat / suspended prices);
+    # clipping to the median would wipe the row, so leave it untouched
+    bound = n_mad * 1.4826 * mad
+    return np.where(mad > 0, np.clip(x, med - bound, med + bound), x)
+
+
+def vol_normalize(x: np.ndarray, returns: np.ndarray, window: int = 20) -> np.ndarray:
+    """
+    Divide each instrument's signal by its trailing return volatility.
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Signal (..., dates, instruments).
+    returns : np.ndarray
+        Per-instrument returns broadcastable to x, used for the rolling std
+        (ddof=1) over the time axis. Windows containing NaN yield NaN.
+    window : int
+        Volatility lookback in days.
+    """
+    if window < 2:
+        raise ValueError("'window' must be >= 2")
+    x = np.asarray(x, dtype=float)
+    r = np.asarray(returns, dtype=float)
+
+    t = r.shape[-2]
+    valid = ~np.isnan(r)
+    filled = np.where(valid, r, 0.0)
+    pad = np.zeros(r.shape[:-2] + (1, r.shape[-1]))
+
+    # rolling sums along the time axis from running totals
+    c1 = np.concatenate([pad, np.cumsum(filled, axis=-2)], axis=-2)
+    c2 = np.concatenate([pad, np.cumsum(filled * filled, axis=-2)], axis=-2)
+    cn = np.concatenate([pad, np.cumsum(valid, axis=-2)], axis=-2)
+
+    vol = np.full(r.shape, np.nan)
+    if t >= window:
+        s1 = c1[..., window:, :] - c1[..., :-window, :]
+        s2 = c2[..., window:, :] - c2[..., :-window, :]
+        cnt = cn[..., window:, :] - cn[..., :-window, :]
+        var = np.maximum((s2 - s1 * s1 / window) / (window - 1), 0.0)
+        vol[..., window - 1:, :] = np.where(cnt == window, np.sqrt(var), np.nan)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(vol > 0, x / vol, np.nan)
+
+
+def normalize(
+    signal: pd.DataFrame | np.ndarray,
+    method: Literal["rank", "zscore", "vol"] = "rank",
+    mad: float | None = None,
+    returns: pd.DataFrame | np.ndarray | None = None,
+    vol_window: int = 20,
+) -> pd.DataFrame | np.ndarray:
+    """
+    Normalise one signal matrix or a batch of them.
+
+    Parameters
+    ----------
+    signal : pd.DataFrame | np.ndarray
+        Signal (dates × instruments), or an array (..., dates, instruments)
+        to normalise many candidate signals in one vectorized call.
+    method : Literal["rank", "zscore", "vol"]
+        'rank'   : cross-sectional rank in [-1, 1]
+        'zscore' : cross-sectional z-score
+        'vol'    : divide by trailing return volatility (requires returns)
+    mad : float, optional
+        If given, MAD-winsorize each cross-section at this many scaled MADs
+        before normalising.
+    returns : pd.DataFrame | np.ndarray, optional
+        Returns used by 'vol', broadcastable to signal.
+    vol_window : int
+        Volatility lookback for 'vol'.
+
+    Returns
+    -------
+    Same type as signal; DataFrames keep their index and columns.
+    """
+    frame = signal if isinstance(signal, pd.DataFrame) else None
+    x = signal.to_numpy(dtype=float) if frame is not None else np.asarray(signal, dtype=float)
+
+    if mad is not None:
+        x = mad_winsorize(x, float(mad))
+
+    if method == "rank":
+        out = cs_rank(x)
+    elif method == "zscore":
+        out = cs_zscore(x)
+    elif method == "vol":
+        if returns is None:
+            raise ValueError("'vol' normalisation requires returns")
+        r = returns.to_numpy(dtype=float) if isinstance(returns, pd.DataFrame) else returns
+        out = vol_normalize(x, r, vol_window)
+    else:
+        raise ValueError("Unknown method, choose 'rank', 'zscore', or 'vol'")
+
+    if frame is not None:
+        return pd.DataFrame(out, index=frame.index, columns=frame.columns)
+    return out